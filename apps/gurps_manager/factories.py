@@ -83,6 +83,29 @@ def create_user():
     user = UserFactory.create(password=make_password(password))  # pylint: disable=E1101
     return [user, password]
 
+def bulk_create(factory, number, **kwargs):
+    """Build ``number`` objects with ``factory`` and save them in one query.
+
+    ``factory`` is a ``DjangoModelFactory`` subclass. ``kwargs`` are passed to
+    ``factory.build_batch``. Return the list of objects built.
+
+    Objects are saved with ``QuerySet.bulk_create``, so ``save`` is not called
+    and, depending on the database backend, primary keys may not be set on the
+    returned objects. Related objects are built but not saved, so pass saved
+    objects for any foreign keys.
+
+    >>> owner = UserFactory.create()
+    >>> campaigns = bulk_create(CampaignFactory, 3, owner=owner)
+    >>> len(campaigns)
+    3
+    >>> models.Campaign.objects.filter(owner=owner).count()
+    3
+
+    """
+    objects = factory.build_batch(number, **kwargs)
+    model = factory._meta.model # pylint: disable=W0212
+    return model.objects.bulk_create(objects)
+
 class CampaignFactory(DjangoModelFactory):
     """Instantiate a ``gurps_manager.models.Campaign`` object.
 
@@ -8,10 +8,10 @@ column named ``id``. Django will not generate ``id`` if you pass ``primary_key =
 True`` to some other column.
 
 """
-from decimal import Decimal
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils.functional import cached_property
 from math import floor
 import re
 
@@ -55,12 +55,35 @@ def validate_quarter(number):
     ... except ValidationError:
     ...     'an exception was raised'
     'an exception was raised'
+    >>> try:
+    ...     validate_quarter(float('inf'))
+    ... except ValidationError:
+    ...     'an exception was raised'
+    'an exception was raised'
 
     """
-    if Decimal(number).quantize(Decimal('0.01')) % Decimal(0.25) \
-    != Decimal(0.00):
+    if not (number * 4.0).is_integer():
         raise ValidationError('{} is not divisible by 0.25.'.format(number))
 
+def _choice_ids(choices):
+    """Map each name in ``choices`` to its ID.
+
+    ``choices`` is a tuple of tuples. The returned dict is meant to be built
+    once, when a model class is defined, so that looking up an ID by name does
+    not scan ``choices`` every time.
+
+    >>> choices = ((1, 'foo'), (2, 'bar'), (42, 'biz'))
+    >>> choice_ids = _choice_ids(choices)
+    >>> choice_ids['foo']
+    1
+    >>> choice_ids['bar']
+    2
+    >>> choice_ids['biz']
+    42
+
+    """
+    return {choice_name: choice_id for choice_id, choice_name in choices}
+
 class Campaign(models.Model):
     """A single role-playing campaign."""
     MAX_LEN_NAME = 50
@@ -79,6 +102,10 @@ class Campaign(models.Model):
         blank=True
     )
 
+    class Meta(object):
+        """Model attributes that are not fields."""
+        ordering = ['id']
+
     def __str__(self):
         """Returns a string representation of the object"""
         return self.name
@@ -94,6 +121,17 @@ class SkillSet(models.Model):
         """Returns a string representation of the object"""
         return self.name
 
+class CharacterManager(models.Manager):
+    """The default manager for ``Character`` objects.
+
+    Nearly every view that lists or checks characters reads each character's
+    campaign, so fetch the campaign in the same query.
+
+    """
+    def get_queryset(self):
+        """Return a queryset that selects each character's campaign."""
+        return super().get_queryset().select_related('campaign')
+
 class Character(models.Model):
     """An individual who can be role-played."""
     # pylint: disable=R0904
@@ -173,34 +211,48 @@ class Character(models.Model):
     used_fatigue = models.FloatField(default=0, validators=[validate_quarter])
 
     # lookup fields
-    appearance = models.IntegerField(choices=APPEARANCE_CHOICES, default=0)
-    wealth = models.IntegerField(choices=WEALTH_CHOICES, default=0)
-    eidetic_memory = models.IntegerField(
+    appearance = models.SmallIntegerField(
+        choices=APPEARANCE_CHOICES,
+        default=0
+    )
+    wealth = models.SmallIntegerField(choices=WEALTH_CHOICES, default=0)
+    eidetic_memory = models.PositiveSmallIntegerField(
         choices=EIDETIC_MEMORY_CHOICES,
         default=0
     )
-    muscle_memory = models.IntegerField(
+    muscle_memory = models.PositiveSmallIntegerField(
         choices=MUSCLE_MEMORY_CHOICES,
         default=0
     )
 
+    objects = CharacterManager()
+
+    class Meta(object):
+        """Model attributes that are not fields."""
+        ordering = ['id']
+
     # derived fields
+    @cached_property
     def fatigue(self):
         """Returns a character's total fatigue"""
         return self.strength + self.bonus_fatigue
 
+    @cached_property
     def hitpoints(self):
         """Returns a character's total hitpoints"""
         return self.health + self.bonus_hitpoints
 
+    @cached_property
     def alertness(self):
         """Returns a character's alertness"""
         return self.intelligence + self.bonus_alertness
 
+    @cached_property
     def will(self):
         """Returns a character's will"""
         return self.intelligence + self.bonus_willpower
 
+    @cached_property
     def fright(self):
         """Returns a character's fright"""
         return self.intelligence + self.bonus_fright
@@ -233,14 +285,14 @@ class Character(models.Model):
     def total_possession_weight(self):
         """Returns the total weight of a character's possessions"""
         total_weight = 0
-        for possession in Possession.objects.filter(character=self):
+        for possession in self.possession_set.all():
             total_weight += (possession.item.weight * possession.quantity)
         return total_weight
 
     def total_possession_value(self):
         """Returns the total value of a character's possessions"""
         total_value = 0
-        for possession in Possession.objects.filter(character=self):
+        for possession in self.possession_set.all():
             total_value += (possession.item.value * possession.quantity)
         return total_value
 
@@ -275,7 +327,7 @@ class Character(models.Model):
         """Returns a character's movement"""
         # Factor in the running skill if they have it.
         running_bonus = 0
-        for skill in CharacterSkill.objects.filter(character=self):
+        for skill in self.characterskill_set.all():
             if re.search('^running$', skill.skill.name, flags=re.IGNORECASE):
                 running_bonus = (skill.score() / 8)
         return floor(self.speed() + running_bonus) \
@@ -345,21 +397,21 @@ class Character(models.Model):
     def total_points_in_skills(self):
         """Returns the points a character has spent in skills"""
         total_points = 0
-        for skill in CharacterSkill.objects.filter(character=self):
+        for skill in self.characterskill_set.all():
             total_points += skill.points
         return total_points
 
     def total_points_in_spells(self):
         """Returns the points a character has spent in spells"""
         total_points = 0
-        for spell in CharacterSpell.objects.filter(character=self):
+        for spell in self.characterspell_set.all():
             total_points += spell.points
         return total_points
 
     def total_points_in_advantages(self):
         """Returns the points a character has spent in advantages"""
         total_points = 0
-        for trait in Trait.objects.filter(character=self):
+        for trait in self.trait_set.all():
             if trait.points > 0:
                 total_points += trait.points
         return total_points
@@ -367,7 +419,7 @@ class Character(models.Model):
     def total_points_in_disadvantages(self):
         """Returns the points a character has spent in disadvantages"""
         total_points = 0
-        for trait in Trait.objects.filter(character=self):
+        for trait in self.trait_set.all():
             if trait.points < 0:
                 total_points += trait.points
         return total_points
@@ -459,6 +511,7 @@ class Skill(models.Model):
         (3, 'Hard'),
         (4, 'Very Hard'),
     )
+    _CATEGORY_IDS = _choice_ids(CATEGORY_CHOICES)
 
     # key fields
     skillset = models.ForeignKey(SkillSet)
@@ -467,8 +520,12 @@ class Skill(models.Model):
     name = models.CharField(max_length=MAX_LEN_NAME)
 
     # lookup fields
-    category = models.IntegerField(choices=CATEGORY_CHOICES)
-    difficulty = models.IntegerField(choices=DIFFICULTY_CHOICES)
+    category = models.PositiveSmallIntegerField(choices=CATEGORY_CHOICES)
+    difficulty = models.PositiveSmallIntegerField(choices=DIFFICULTY_CHOICES)
+
+    class Meta(object):
+        """Model attributes that are not fields."""
+        ordering = ['id']
 
     def __str__(self):
         """Returns a string representation of the object"""
@@ -478,13 +535,23 @@ class Skill(models.Model):
     def get_category_id(cls, name):
         """Given a name from ``CATEGORY_CHOICES``, return its ID.
 
+        If ``name`` is not in ``CATEGORY_CHOICES``, raise a ``ValueError``.
+
         >>> Skill.get_category_id('Mental')
         1
         >>> Skill.get_category_id('Psionic')
         6
+        >>> try:
+        ...     Skill.get_category_id('foo')
+        ... except ValueError:
+        ...     'an exception was raised'
+        'an exception was raised'
 
         """
-        return _get_choice_id(cls.CATEGORY_CHOICES, name)
+        try:
+            return cls._CATEGORY_IDS[name]
+        except KeyError:
+            raise ValueError('{} is not a known category'.format(name))
 
 class CharacterSkill(models.Model):
     """A skill that a character possesses"""
@@ -503,6 +570,10 @@ class CharacterSkill(models.Model):
     # float fields
     points = models.FloatField(validators=[validate_quarter], default=0)
 
+    class Meta(object):
+        """Model attributes that are not fields."""
+        index_together = (('character', 'skill'),)
+
     def score(self):
         """Returns a character's score in a given skill
 
@@ -629,6 +700,7 @@ class Spell(models.Model):
         (3, 'Hard'),
         (4, 'Very Hard'),
     )
+    _DIFFICULTY_IDS = _choice_ids(DIFFICULTY_CHOICES)
 
     # key fields
     campaign = models.ForeignKey(Campaign)
@@ -649,7 +721,11 @@ class Spell(models.Model):
     )
 
     # lookup fields
-    difficulty = models.IntegerField(choices=DIFFICULTY_CHOICES)
+    difficulty = models.PositiveSmallIntegerField(choices=DIFFICULTY_CHOICES)
+
+    class Meta(object):
+        """Model attributes that are not fields."""
+        ordering = ['id']
 
     def __str__(self):
         """Returns a string representation of the object"""
@@ -659,13 +735,23 @@ class Spell(models.Model):
     def get_difficulty_id(cls, name):
         """Given a name from ``DIFFICULTY_CHOICES``, return its ID.
 
+        If ``name`` is not in ``DIFFICULTY_CHOICES``, raise a ``ValueError``.
+
         >>> Spell.get_difficulty_id('Hard')
         3
         >>> Spell.get_difficulty_id('Very Hard')
         4
+        >>> try:
+        ...     Spell.get_difficulty_id('foo')
+        ... except ValueError:
+        ...     'an exception was raised'
+        'an exception was raised'
 
         """
-        return _get_choice_id(cls.DIFFICULTY_CHOICES, name)
+        try:
+            return cls._DIFFICULTY_IDS[name]
+        except KeyError:
+            raise ValueError('{} is not a known difficulty'.format(name))
 
 class CharacterSpell(models.Model):
     """A spell that a character may know"""
@@ -679,6 +765,10 @@ class CharacterSpell(models.Model):
     # float fields
     points = models.FloatField(validators=[validate_quarter], default=0)
 
+    class Meta(object):
+        """Model attributes that are not fields."""
+        index_together = (('character', 'spell'),)
+
     def _base_score(self):
         """Return a base score used to calculate an actual score.
 
@@ -747,6 +837,10 @@ class Possession(models.Model):
     # integer fields
     quantity = models.IntegerField(validators=[validate_not_negative])
 
+    class Meta(object):
+        """Model attributes that are not fields."""
+        index_together = (('character', 'item'),)
+
 class HitLocation(models.Model):
     """A location on a character that can be affected
 
@@ -771,23 +865,3 @@ class HitLocation(models.Model):
     def __str__(self):
         """Returns a string representation of the object"""
         return self.name
-
-def _get_choice_id(choices, choice_name):
-    """Given a name from ``choices``, return its ID.
-
-    ``choices`` is a tuple of tuples.
-
-    >>> choices = ((1, 'foo'), (2, 'bar'), (42, 'biz'))
-    >>> _get_choice_id(choices, 'foo')
-    1
-    >>> _get_choice_id(choices, 'bar')
-    2
-    >>> _get_choice_id(choices, 'biz')
-    42
-
-    """
-    # e.g. ['foo', 'bar', 'biz']
-    choice_names = [choice[1] for choice in choices]
-    # e.g. (1, 'foo')
-    choice = choices[choice_names.index(choice_name)]
-    return choice[0]
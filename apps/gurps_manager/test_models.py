@@ -4,7 +4,7 @@ Each test case in this module tests a single model. For example, the
 ``CampaignTestCase`` tests just the ``Campaign`` model.
 
 """
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from gurps_manager import factories, models
 from math import floor
 import random
@@ -16,8 +16,12 @@ import random
 # pylint: disable=R0904
 # R: 11, 0: Too many public methods (72/20) (too-many-public-methods)
 # All classes inheriting from TestCase will cause this warning.
+#
+# Test cases which only build objects, and never save them, inherit from
+# SimpleTestCase. This skips the transaction that TestCase wraps around each
+# test.
 
-class CampaignTestCase(TestCase):
+class CampaignTestCase(SimpleTestCase):
     """Tests for ``Campaign``."""
     def test_str(self):
         """Test the ``__str__`` method."""
@@ -25,63 +29,32 @@ class CampaignTestCase(TestCase):
         campaign = factories.CampaignFactory.build(name=name)
         self.assertEqual(name, str(campaign))
 
-class CharacterTestCase(TestCase):
-    """Tests for ``Character``."""
+class CharacterUnsavedTestCase(SimpleTestCase):
+    """Tests for ``Character`` that do not touch the database."""
     def test_str(self):
         """Test the ``__str__`` method."""
         name = factories.character_name()
         character = factories.CharacterFactory.build(name=name)
         self.assertEqual(name, str(character))
 
-    def test_fatigue(self):
-        """Test the ``fatigue`` method."""
-        strength = factories.character_intfield()
-        bonus_fatigue = factories.character_intfield()
-        character = factories.CharacterFactory.build(
-            strength=strength,
-            bonus_fatigue=bonus_fatigue,
-        )
-        self.assertEqual(character.fatigue(), strength + bonus_fatigue)
-
-    def test_hitpoints(self):
-        """Test the ``hitpoints`` method."""
-        health = factories.character_intfield()
-        bonus_hitpoints = factories.character_intfield()
-        character = factories.CharacterFactory.build(
-            health=health,
-            bonus_hitpoints=bonus_hitpoints,
-        )
-        self.assertEqual(character.hitpoints(), health + bonus_hitpoints)
-
-    def test_alertness(self):
-        """Test the ``alertness`` method."""
-        intelligence = factories.character_intfield()
-        bonus_alertness = factories.character_intfield()
-        character = factories.CharacterFactory.build(
-            intelligence=intelligence,
-            bonus_alertness=bonus_alertness,
-        )
-        self.assertEqual(character.alertness(), intelligence + bonus_alertness)
-
-    def test_will(self):
-        """Test the ``will`` method."""
-        intelligence = factories.character_intfield()
-        bonus_willpower = factories.character_intfield()
-        character = factories.CharacterFactory.build(
-            intelligence=intelligence,
-            bonus_willpower=bonus_willpower,
-        )
-        self.assertEqual(character.will(), intelligence + bonus_willpower)
+    def test_derived_fields(self):
+        """Test the ``fatigue``, ``hitpoints``, ``alertness``, ``will`` and
+        ``fright`` properties.
 
-    def test_fright(self):
-        """Test the ``fright`` method."""
-        intelligence = factories.character_intfield()
-        bonus_fright = factories.character_intfield()
-        character = factories.CharacterFactory.build(
-            intelligence=intelligence,
-            bonus_fright=bonus_fright,
-        )
-        self.assertEqual(character.fright(), intelligence + bonus_fright)
+        """
+        character = factories.CharacterFactory.build()
+        for name, expected in (
+                ('fatigue', character.strength + character.bonus_fatigue),
+                ('hitpoints', character.health + character.bonus_hitpoints),
+                (
+                    'alertness',
+                    character.intelligence + character.bonus_alertness
+                ),
+                ('will', character.intelligence + character.bonus_willpower),
+                ('fright', character.intelligence + character.bonus_fright),
+        ):
+            with self.subTest(name=name):
+                self.assertEqual(getattr(character, name), expected)
 
     def test_initiative(self):
         """Test the ``initiative`` method."""
@@ -128,6 +101,8 @@ class CharacterTestCase(TestCase):
         character = factories.CharacterFactory.build(strength=strength)
         self.assertEqual(character.extra_heavy_encumbrance(), strength * 20)
 
+class CharacterTestCase(TestCase):
+    """Tests for ``Character`` that save objects to the database."""
     def test_total_possession_weight(self):
         """Test the ``total_possession_weight`` method."""
         # Zero items.
@@ -438,7 +413,7 @@ class CharacterTestCase(TestCase):
                 + character.total_points_in_special_traits()
         )
 
-class SkillSetTestCase(TestCase):
+class SkillSetTestCase(SimpleTestCase):
     """Tests for ``SkillSet``."""
     def test_str(self):
         """Test the ``__str__`` method."""
@@ -446,7 +421,7 @@ class SkillSetTestCase(TestCase):
         skillset = factories.SkillSetFactory.build(name=name)
         self.assertEqual(name, str(skillset))
 
-class SkillTestCase(TestCase):
+class SkillTestCase(SimpleTestCase):
     """Tests for ``Skill``."""
     def test_str(self):
         """Test the ``__str__`` method."""
@@ -454,7 +429,7 @@ class SkillTestCase(TestCase):
         skill = factories.SkillFactory.build(name=name)
         self.assertEqual(name, str(skill))
 
-class TraitTestCase(TestCase):
+class TraitTestCase(SimpleTestCase):
     """Tests for ``Trait``."""
     def test_str(self):
         """Test the ``__str__`` method."""
@@ -462,7 +437,7 @@ class TraitTestCase(TestCase):
         trait = factories.TraitFactory.build(name=name)
         self.assertEqual(name, str(trait))
 
-class ItemTestCase(TestCase):
+class ItemTestCase(SimpleTestCase):
     """Tests for ``Item``."""
     def test_str(self):
         """Test the ``__str__`` method."""
@@ -470,7 +445,7 @@ class ItemTestCase(TestCase):
         item = factories.ItemFactory.build(name=name)
         self.assertEqual(name, str(item))
 
-class SpellTestCase(TestCase):
+class SpellTestCase(SimpleTestCase):
     """Tests for ``Spell``."""
     def test_str(self):
         """Test the ``__str__`` method."""
@@ -478,7 +453,7 @@ class SpellTestCase(TestCase):
         spell = factories.SpellFactory.build(name=name)
         self.assertEqual(name, str(spell))
 
-class HitLocationTestCase(TestCase):
+class HitLocationTestCase(SimpleTestCase):
     """Tests for ``HitLocation``."""
     def test_str(self):
         """Test the ``__str__`` method."""
@@ -108,6 +108,11 @@ class LoginTestCase(TestCase):
 class CampaignTestCase(TestCase):
     """Tests for the ``campaign/`` path."""
     PATH = reverse('gurps-manager-campaign')
+    # e.g. '/campaign/{}/'
+    ID_PATH = reverse('gurps-manager-campaign-id', args=[0]).replace(
+        '/0/',
+        '/{}/'
+    )
 
     def setUp(self):
         """Authenticate the test client."""
@@ -119,22 +124,20 @@ class CampaignTestCase(TestCase):
 
     def test_post(self):
         """POST ``self.PATH``."""
-        # A Campaign object contains FKs pointing to other objects. Save those
-        # remote objects, and place their IDs in a dict.
-        campaign_attrs = factories.CampaignFactory.attributes()
-        campaign_attrs['owner'].save()
-        campaign_attrs['owner'] = self.user.id
+        # A Campaign object contains FKs pointing to other objects. Place the
+        # IDs of existing objects in the dict rather than building new ones.
+        campaign_attrs = factories.CampaignFactory.attributes(
+            extra={'owner': self.user.id}
+        )
 
-        num_campaigns = models.Campaign.objects.count()
+        # POSTing to self.PATH should create a new Campaign object, and the
+        # client should be redirected to it.
         response = self.client.post(self.PATH, campaign_attrs)
-        self.assertEqual(models.Campaign.objects.count(), num_campaigns + 1)
-        self.assertRedirects(
-            response,
-            reverse(
-                'gurps-manager-campaign-id',
-                args=[models.Campaign.objects.latest('id').id]
-            )
+        campaign_id = _redirect_id(response)
+        self.assertTrue(
+            models.Campaign.objects.filter(id=campaign_id).exists()
         )
+        self.assertRedirects(response, self.ID_PATH.format(campaign_id))
 
     def test_post_failure(self):
         """POST ``self.PATH``, incorrectly."""
@@ -237,9 +240,9 @@ class CampaignIdTestCase(TestCase):
 
     def test_put(self):
         """Update a campaign."""
-        data = factories.CampaignFactory.attributes()
-        data['owner'].save()
-        data['owner'] = self.campaign.owner.id
+        data = factories.CampaignFactory.attributes(
+            extra={'owner': self.campaign.owner.id}
+        )
         data['_method'] = 'PUT'
         response = self.client.post(self.path, data)
         self.assertRedirects(response, self.path)
@@ -712,6 +715,11 @@ class CampaignIdItemsTestCase(TestCase):
 class CharacterTestCase(TestCase):
     """Tests for the ``character/`` path."""
     PATH = reverse('gurps-manager-character')
+    # e.g. '/character/{}/'
+    ID_PATH = reverse('gurps-manager-character-id', args=[0]).replace(
+        '/0/',
+        '/{}/'
+    )
 
     def setUp(self):
         """Authenticate the test client."""
@@ -723,25 +731,22 @@ class CharacterTestCase(TestCase):
 
     def test_post(self):
         """POST ``self.PATH``."""
-        # A Character object contains FKs pointing to other objects. Save those
-        # remote objects, and place their IDs in a dict.
-        char_attrs = factories.CharacterFactory.attributes()
-        char_attrs['campaign'] = factories.CampaignFactory.create().id
-        char_attrs['owner'] = self.user.id
+        # A Character object contains FKs pointing to other objects. Place the
+        # IDs of existing objects in the dict rather than building new ones.
+        char_attrs = factories.CharacterFactory.attributes(extra={
+            'campaign': factories.CampaignFactory.create().id,
+            'owner': self.user.id,
+        })
 
         # POSTing to self.PATH should create a new Character object.
-        num_characters = models.Character.objects.count()
         response = self.client.post(self.PATH, char_attrs)
-        self.assertEqual(models.Character.objects.count(), num_characters + 1)
+        character_id = _redirect_id(response)
+        self.assertTrue(
+            models.Character.objects.filter(id=character_id).exists()
+        )
 
         # The client should be redirected after successfully POSTing.
-        self.assertRedirects(
-            response,
-            reverse(
-                'gurps-manager-character-id',
-                args=[models.Character.objects.latest('id').id]
-            )
-        )
+        self.assertRedirects(response, self.ID_PATH.format(character_id))
 
     def test_post_failure(self):
         """POST ``self.PATH``, incorrectly."""
@@ -756,6 +761,19 @@ class CharacterTestCase(TestCase):
         response = self.client.get(self.PATH)
         self.assertEqual(response.status_code, 200)
 
+    def test_get_many(self):
+        """GET ``self.PATH`` when the user can view several characters."""
+        campaign = factories.CampaignFactory.create(owner=self.user)
+        factories.bulk_create(
+            factories.CharacterFactory,
+            10,
+            campaign=campaign,
+            owner=self.user,
+        )
+        response = self.client.get(self.PATH)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['table'].rows), 10)
+
     def test_put(self):
         """POST ``self.PATH`` and emulate a PUT request."""
         response = self.client.put(self.PATH, {'_method': 'PUT'})
@@ -843,9 +861,10 @@ class CharacterIdTestCase(TestCase):
 
     def test_put(self):
         """Update ``self.character``."""
-        data = factories.CharacterFactory.attributes()
-        data['campaign'] = self.character.campaign.id # Make FK attribute sane
-        data['owner'] = self.character.owner.id # Make FK attribute sane
+        data = factories.CharacterFactory.attributes(extra={
+            'campaign': self.character.campaign.id,
+            'owner': self.character.owner.id,
+        })
         data['_method'] = 'PUT'
         response = self.client.post(self.path, data)
         self.assertRedirects(response, self.path)
@@ -1776,6 +1795,15 @@ def _login(client):
     client.login(username=user.username, password=password)
     return [user, password]
 
+def _redirect_id(response):
+    """Return the object ID at the end of the URL ``response`` redirects to.
+
+    ``response`` is a redirect to a path such as ``campaign/15/``. The returned
+    ID is an integer, such as ``15``.
+
+    """
+    return int(response['Location'].rstrip('/').rsplit('/', 1)[-1])
+
 def _test_login_required(test_case, url=None):
     """Logout ``test_case.client``, then GET ``url``.
 
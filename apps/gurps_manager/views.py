@@ -257,7 +257,17 @@ class Character(View):
         Only show characters that ``_viewable_characters`` returns.
 
         """
-        characters = _viewable_characters(request.user)
+        # The table does not display ``story``, which can be long. Each row
+        # shows its owner and the points spent on skills, spells and traits.
+        # Before Django 1.7, select_related replaces earlier lookups rather
+        # than adding to them, so repeat the manager's ``campaign`` lookup.
+        characters = _viewable_characters(request.user).defer('story')
+        characters = characters.select_related('campaign', 'owner')
+        characters = characters.prefetch_related(
+            'characterskill_set',
+            'characterspell_set',
+            'trait_set',
+        )
         character_table_cls = tables.character_table(request.user)
         table = character_table_cls(characters)
         RequestConfig(request).configure(table)
@@ -271,7 +281,19 @@ class CharacterId(View):
     """Handle a request for ``character/<id>/``."""
     def get(self, request, character_id):
         """Return information about character ``character_id``."""
-        character = _get_model_object_or_404(models.Character, character_id)
+        # The character sheet walks each of these relations several times.
+        characters = models.Character.objects.prefetch_related(
+            'characterskill_set__skill',
+            'characterspell_set__spell',
+            'possession_set__item',
+            'trait_set',
+            'hitlocation_set',
+        )
+        character = _get_model_object_or_404(
+            models.Character,
+            character_id,
+            characters
+        )
         if character not in _viewable_characters(request.user):
             return http.HttpResponseForbidden(
                 'Error: you do not have the rights to view this character.'
@@ -929,11 +951,13 @@ def _decode_request(request):
         return request.POST.get('_method', 'POST')
     return request.method
 
-def _get_model_object_or_404(model, object_id):
+def _get_model_object_or_404(model, object_id, queryset=None):
     """Return an object of type ``model`` with ID ``object_id``.
 
     ``model`` is a model class. (Class ``model`` is probably defined in file
     ``models.py``.) ``object_id`` is the ID of one of those objects.
+    ``queryset`` is an optional queryset of ``model`` objects to search instead
+    of ``model.objects``. Use it to select or prefetch related objects.
 
     If an object with ID ``object_id`` cannot be found, raise exception
     ``django.http.Http404``.
@@ -949,10 +973,20 @@ def _get_model_object_or_404(model, object_id):
     ... except Http404:
     ...     'an exception was raised'
     'an exception was raised'
+    >>> queryset = models.Campaign.objects.select_related('owner')
+    >>> campaign3 = _get_model_object_or_404(
+    ...     models.Campaign,
+    ...     campaign.id,
+    ...     queryset
+    ... )
+    >>> campaign == campaign3
+    True
 
     """
+    if queryset is None:
+        queryset = model.objects
     try:
-        return model.objects.get(id=object_id)
+        return queryset.get(id=object_id)
     except model.DoesNotExist:
         raise http.Http404
 